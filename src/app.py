@@ -19,61 +19,62 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database. Participants are stored as sets so the
+# duplicate-signup and unregister membership checks are O(1).
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Competitive basketball training and games",
         "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu"]
+        "participants": {"james@mergington.edu"}
     },
     "Tennis Club": {
         "description": "Tennis skills development and friendly matches",
         "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
         "max_participants": 16,
-        "participants": ["sarah@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"sarah@mergington.edu", "lucas@mergington.edu"}
     },
     "Art Studio": {
         "description": "Painting, drawing, and visual arts creation",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["grace@mergington.edu"]
+        "participants": {"grace@mergington.edu"}
     },
     "Music Band": {
         "description": "Learn instruments and perform in school concerts",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
         "max_participants": 25,
-        "participants": ["alex@mergington.edu", "nina@mergington.edu"]
+        "participants": {"alex@mergington.edu", "nina@mergington.edu"}
     },
     "Debate Club": {
         "description": "Develop public speaking and critical thinking skills",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["marcus@mergington.edu"]
+        "participants": {"marcus@mergington.edu"}
     },
     "Science Olympiad": {
         "description": "Compete in science competitions and experiments",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "ethan@mergington.edu"}
     }
 }
 
@@ -85,7 +86,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Serialize participant sets as sorted lists for a deterministic response
+    return {
+        name: {**data, "participants": sorted(data["participants"])}
+        for name, data in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +108,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
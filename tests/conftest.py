@@ -0,0 +1,21 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Provide a single TestClient shared across the whole test session.
+
+    State isolation is handled by the reset_activities fixture, so sharing
+    the client is safe and avoids rebuilding the ASGI transport per test.
+    Entering the client as a context manager runs the app's lifespan
+    (startup/shutdown) exactly once for the whole session.
+    """
+    with TestClient(app) as c:
+        yield c
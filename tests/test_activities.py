@@ -5,90 +5,108 @@ Tests cover all endpoints with happy paths, error cases, and edge cases.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from urllib.parse import quote
 
 from app import app, activities
 
+# Initial state of the in-memory activity database, mirrored from app.py.
+_INITIAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball training and games",
+        "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["james@mergington.edu"]
+    },
+    "Tennis Club": {
+        "description": "Tennis skills development and friendly matches",
+        "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
+        "max_participants": 16,
+        "participants": ["sarah@mergington.edu", "lucas@mergington.edu"]
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and visual arts creation",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["grace@mergington.edu"]
+    },
+    "Music Band": {
+        "description": "Learn instruments and perform in school concerts",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": ["alex@mergington.edu", "nina@mergington.edu"]
+    },
+    "Debate Club": {
+        "description": "Develop public speaking and critical thinking skills",
+        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 14,
+        "participants": ["marcus@mergington.edu"]
+    },
+    "Science Olympiad": {
+        "description": "Compete in science competitions and experiments",
+        "schedule": "Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
+    }
+}
 
-@pytest.fixture
-def client():
-    """Provide a TestClient with fresh app state."""
-    return TestClient(app)
 
+def _snapshot():
+    """Return a fresh copy of the initial state.
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test."""
-    # Store initial state
-    initial_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and games",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Tennis skills development and friendly matches",
-            "schedule": "Wednesdays and Saturdays, 3:00 PM - 4:30 PM",
-            "max_participants": 16,
-            "participants": ["sarah@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and visual arts creation",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["grace@mergington.edu"]
-        },
-        "Music Band": {
-            "description": "Learn instruments and perform in school concerts",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "nina@mergington.edu"]
-        },
-        "Debate Club": {
-            "description": "Develop public speaking and critical thinking skills",
-            "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["marcus@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science competitions and experiments",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
-        }
+    Only the participants collections are mutable, so a shallow copy
+    per activity plus a new set is enough -- no full deepcopy needed.
+    """
+    return {
+        name: {**data, "participants": set(data["participants"])}
+        for name, data in _INITIAL_ACTIVITIES.items()
     }
-    
-    # Clear and repopulate activities
+
+
+def _url(name, op):
+    """Build an encoded endpoint path for an activity, e.g. _url("Chess Club", "signup")."""
+    return f"/activities/{quote(name)}/{op}"
+
+
+def _preregister(activity, email):
+    """Register a participant directly, bypassing the HTTP layer.
+
+    Used for test setup where the signup path itself is not under test,
+    so setup costs a set insert instead of a full ASGI POST cycle.
+    """
+    activities[activity]["participants"].add(email)
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state around a mutating test.
+
+    Opt-in via @pytest.mark.usefixtures on classes that mutate state;
+    read-only test classes skip the reset cost entirely.
+    """
     activities.clear()
-    activities.update(initial_activities)
+    activities.update(_snapshot())
     yield
     # Cleanup after test
     activities.clear()
-    activities.update(initial_activities)
+    activities.update(_snapshot())
 
 
 # ============================================================================
@@ -98,9 +116,14 @@ def reset_activities():
 class TestRoot:
     """Test the root endpoint."""
 
-    def test_root_redirects_to_static_index(self, client):
-        """Root path should redirect to /static/index.html."""
-        response = client.get("/", follow_redirects=False)
+    def test_root_redirects_to_static_index(self):
+        """Root path should redirect to /static/index.html.
+
+        Pure metadata check: inspect the route and call its endpoint
+        directly rather than dispatching through the full ASGI stack.
+        """
+        root = next(r for r in app.routes if getattr(r, "path", None) == "/")
+        response = root.endpoint()
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -137,7 +160,7 @@ class TestGetActivities:
         
         required_fields = {"description", "schedule", "max_participants", "participants"}
         for activity_name, activity_data in data.items():
-            assert required_fields.issubset(activity_data.keys()), \
+            assert required_fields <= activity_data.keys(), \
                 f"Activity '{activity_name}' missing required fields"
 
     def test_participants_are_email_list(self, client):
@@ -145,28 +168,29 @@ class TestGetActivities:
         response = client.get("/activities")
         data = response.json()
         
-        for activity_name, activity_data in data.items():
-            participants = activity_data["participants"]
-            assert isinstance(participants, list), \
-                f"Participants in '{activity_name}' should be a list"
-            for participant in participants:
-                assert isinstance(participant, str), \
-                    f"Participant in '{activity_name}' should be string (email)"
-                assert "@" in participant, \
-                    f"Participant in '{activity_name}' should be valid email format"
+        assert all(
+            isinstance(activity_data["participants"], list)
+            for activity_data in data.values()
+        ), "Every activity's participants should be a list"
+        assert all(
+            isinstance(participant, str) and "@" in participant
+            for activity_data in data.values()
+            for participant in activity_data["participants"]
+        ), "Every participant should be an email string"
 
 
 # ============================================================================
 # Tests for POST /activities/{activity_name}/signup
 # ============================================================================
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignup:
     """Test the signup endpoint."""
 
     def test_successful_signup(self, client):
         """Student should successfully sign up for an activity."""
         response = client.post(
-            "/activities/Art%20Studio/signup",
+            _url("Art Studio", "signup"),
             params={"email": "newstudent@mergington.edu"}
         )
         
@@ -184,7 +208,7 @@ class TestSignup:
     def test_signup_activity_not_found(self, client):
         """Signup should return 404 if activity doesn't exist."""
         response = client.post(
-            "/activities/Nonexistent%20Activity/signup",
+            _url("Nonexistent Activity", "signup"),
             params={"email": "student@mergington.edu"}
         )
         
@@ -196,7 +220,7 @@ class TestSignup:
         """Signup should return 400 if student already signed up."""
         # Try to signup someone already registered
         response = client.post(
-            "/activities/Chess%20Club/signup",
+            _url("Chess Club", "signup"),
             params={"email": "michael@mergington.edu"}
         )
         
@@ -210,14 +234,14 @@ class TestSignup:
         
         # Signup for first activity
         response1 = client.post(
-            "/activities/Chess%20Club/signup",
+            _url("Chess Club", "signup"),
             params={"email": email}
         )
         assert response1.status_code == 200
         
         # Signup for second activity
         response2 = client.post(
-            "/activities/Programming%20Class/signup",
+            _url("Programming Class", "signup"),
             params={"email": email}
         )
         assert response2.status_code == 200
@@ -232,7 +256,7 @@ class TestSignup:
         """Should handle emails with special characters."""
         email = "student+lab@mergington.edu"
         response = client.post(
-            "/activities/Art%20Studio/signup",
+            _url("Art Studio", "signup"),
             params={"email": email}
         )
         
@@ -246,13 +270,14 @@ class TestSignup:
 # Tests for DELETE /activities/{activity_name}/unregister
 # ============================================================================
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregister:
     """Test the unregister endpoint."""
 
     def test_successful_unregister(self, client):
         """Student should successfully unregister from an activity."""
         response = client.delete(
-            "/activities/Chess%20Club/unregister",
+            _url("Chess Club", "unregister"),
             params={"email": "michael@mergington.edu"}
         )
         
@@ -270,7 +295,7 @@ class TestUnregister:
     def test_unregister_activity_not_found(self, client):
         """Unregister should return 404 if activity doesn't exist."""
         response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister",
+            _url("Nonexistent Activity", "unregister"),
             params={"email": "student@mergington.edu"}
         )
         
@@ -281,7 +306,7 @@ class TestUnregister:
     def test_unregister_not_registered(self, client):
         """Unregister should return 400 if student is not registered."""
         response = client.delete(
-            "/activities/Chess%20Club/unregister",
+            _url("Chess Club", "unregister"),
             params={"email": "notregistered@mergington.edu"}
         )
         
@@ -293,47 +318,45 @@ class TestUnregister:
         """Should be able to unregister from all activities."""
         email = "testuser@mergington.edu"
         
-        # First signup for multiple activities
-        client.post("/activities/Chess%20Club/signup", params={"email": email})
-        client.post("/activities/Art%20Studio/signup", params={"email": email})
+        # First register for multiple activities (setup, not under test)
+        _preregister("Chess Club", email)
+        _preregister("Art Studio", email)
         
         # Unregister from first
         response1 = client.delete(
-            "/activities/Chess%20Club/unregister",
+            _url("Chess Club", "unregister"),
             params={"email": email}
         )
         assert response1.status_code == 200
         
         # Unregister from second
         response2 = client.delete(
-            "/activities/Art%20Studio/unregister",
+            _url("Art Studio", "unregister"),
             params={"email": email}
         )
         assert response2.status_code == 200
         
-        # Verify not in either
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert email not in data["Chess Club"]["participants"]
-        assert email not in data["Art Studio"]["participants"]
+        # Verify not in either (inspect state directly, no redundant round trip)
+        assert email not in activities["Chess Club"]["participants"]
+        assert email not in activities["Art Studio"]["participants"]
 
     def test_unregister_same_person_twice(self, client):
         """Unregistering same person twice should fail on second attempt."""
         email = "testuser@mergington.edu"
         
-        # Signup first
-        client.post("/activities/Chess%20Club/signup", params={"email": email})
+        # Register first (setup, not under test)
+        _preregister("Chess Club", email)
         
         # First unregister
         response1 = client.delete(
-            "/activities/Chess%20Club/unregister",
+            _url("Chess Club", "unregister"),
             params={"email": email}
         )
         assert response1.status_code == 200
         
         # Second unregister should fail
         response2 = client.delete(
-            "/activities/Chess%20Club/unregister",
+            _url("Chess Club", "unregister"),
             params={"email": email}
         )
         assert response2.status_code == 400
@@ -343,33 +366,32 @@ class TestUnregister:
 # Integration and Complex Scenarios
 # ============================================================================
 
+@pytest.mark.usefixtures("reset_activities")
 class TestIntegrationScenarios:
     """Test complex real-world scenarios."""
 
     def test_signup_and_unregister_cycle(self, client):
         """Complete cycle: signup, verify, unregister, verify."""
         email = "cycle@mergington.edu"
-        activity = "Art%20Studio"
+        activity = "Art Studio"
         
-        # Initial state: not registered
+        # Initial state: not registered (one GET to exercise the HTTP path)
         response = client.get("/activities")
         assert email not in response.json()["Art Studio"]["participants"]
-        
+
         # Signup
-        signup_response = client.post(f"/activities/{activity}/signup", params={"email": email})
+        signup_response = client.post(_url(activity, "signup"), params={"email": email})
         assert signup_response.status_code == 200
-        
-        # Verify registered
-        response = client.get("/activities")
-        assert email in response.json()["Art Studio"]["participants"]
-        
+
+        # Verify registered (inspect state directly, no redundant round trip)
+        assert email in activities["Art Studio"]["participants"]
+
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister", params={"email": email})
+        unregister_response = client.delete(_url(activity, "unregister"), params={"email": email})
         assert unregister_response.status_code == 200
-        
+
         # Verify not registered
-        response = client.get("/activities")
-        assert email not in response.json()["Art Studio"]["participants"]
+        assert email not in activities["Art Studio"]["participants"]
 
     def test_multiple_concurrent_signups(self, client):
         """Multiple different students signups should work."""
@@ -381,16 +403,16 @@ class TestIntegrationScenarios:
         
         for email in emails:
             response = client.post(
-                "/activities/Programming%20Class/signup",
+                _url("Programming Class", "signup"),
                 params={"email": email}
             )
             assert response.status_code == 200
         
-        # Verify all are registered
+        # Verify all are registered with one set-membership check
         activities_response = client.get("/activities")
         data = activities_response.json()
-        for email in emails:
-            assert email in data["Programming Class"]["participants"]
+        participants = set(data["Programming Class"]["participants"])
+        assert participants.issuperset(emails)
 
     def test_activity_with_spaces_in_name(self, client):
         """Activities with spaces should be URL encoded properly."""
@@ -400,7 +422,7 @@ class TestIntegrationScenarios:
         
         # Signup for activity with spaces
         signup_response = client.post(
-            "/activities/Programming%20Class/signup",
+            _url("Programming Class", "signup"),
             params={"email": "test@mergington.edu"}
         )
         assert signup_response.status_code == 200
@@ -409,18 +431,14 @@ class TestIntegrationScenarios:
         """Participant count should update on signup/unregister."""
         email = "counter@mergington.edu"
         
-        # Get initial count
-        response1 = client.get("/activities")
-        initial_count = len(response1.json()["Gym Class"]["participants"])
-        
+        # Get initial count (one GET to exercise the HTTP path)
+        response = client.get("/activities")
+        initial_count = len(response.json()["Gym Class"]["participants"])
+
         # Signup
-        client.post("/activities/Gym%20Class/signup", params={"email": email})
-        response2 = client.get("/activities")
-        after_signup_count = len(response2.json()["Gym Class"]["participants"])
-        assert after_signup_count == initial_count + 1
-        
+        client.post(_url("Gym Class", "signup"), params={"email": email})
+        assert len(activities["Gym Class"]["participants"]) == initial_count + 1
+
         # Unregister
-        client.delete("/activities/Gym%20Class/unregister", params={"email": email})
-        response3 = client.get("/activities")
-        after_unregister_count = len(response3.json()["Gym Class"]["participants"])
-        assert after_unregister_count == initial_count
+        client.delete(_url("Gym Class", "unregister"), params={"email": email})
+        assert len(activities["Gym Class"]["participants"]) == initial_count